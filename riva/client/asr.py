@@ -58,6 +58,11 @@ class AudioChunkFileIterator:
             warnings.warn(f"delay_callback not supported for encoding other than LINEAR_PCM")
             self.delay_callback = None
         self.first_buffer = True
+        if self.file_parameters:
+            self._chunk_n_bytes = chunk_n_frames * self.file_parameters['sampwidth'] * self.file_parameters['nchannels']
+            self._bytes_per_second = self.file_parameters['sampwidth'] * self.file_parameters['framerate']
+        else:
+            self._chunk_n_bytes = chunk_n_frames
 
     def close(self) -> None:
         self.file_object.close()
@@ -74,18 +79,13 @@ class AudioChunkFileIterator:
         return self
 
     def __next__(self) -> bytes:
-        if self.file_parameters:
-            data = self.file_object.read(self.chunk_n_frames * self.file_parameters['sampwidth'] * self.file_parameters['nchannels'])
-        else:
-            data = self.file_object.read(self.chunk_n_frames)
+        data = self.file_object.read(self._chunk_n_bytes)
         if not data:
             self.close()
             raise StopIteration
         if self.delay_callback is not None:
             offset = self.file_parameters['data_offset'] if self.first_buffer else 0
-            self.delay_callback(
-                data[offset:], (len(data) - offset) / self.file_parameters['sampwidth'] / self.file_parameters['framerate']
-            )
+            self.delay_callback(data[offset:], (len(data) - offset) / self._bytes_per_second)
             self.first_buffer = False
         return data
 
@@ -128,6 +128,11 @@ def add_speaker_diarization_to_config(
         inner_config.diarization_config.CopyFrom(diarization_config)
 
 
+ENDPOINTING_CONFIG_FIELDS = (
+    'start_history', 'start_threshold', 'stop_history', 'stop_history_eou', 'stop_threshold', 'stop_threshold_eou'
+)
+
+
 def add_endpoint_parameters_to_config(
     config: Union[rasr.StreamingRecognitionConfig, rasr.RecognitionConfig],
     start_history: int,
@@ -137,24 +142,12 @@ def add_endpoint_parameters_to_config(
     stop_threshold: float,
     stop_threshold_eou: float,
 ) -> None:
-    if not (start_history > 0 or start_threshold > 0 or stop_history > 0 or stop_history_eou > 0 or stop_threshold > 0 or stop_threshold_eou > 0):
-        return 
-         
+    values = (start_history, start_threshold, stop_history, stop_history_eou, stop_threshold, stop_threshold_eou)
+    endpointing_parameters = {name: value for name, value in zip(ENDPOINTING_CONFIG_FIELDS, values) if value > 0}
+    if not endpointing_parameters:
+        return
     inner_config: rasr.RecognitionConfig = config if isinstance(config, rasr.RecognitionConfig) else config.config
-    endpointing_config = rasr.EndpointingConfig()
-    if start_history > 0:
-        endpointing_config.start_history = start_history
-    if start_threshold > 0:
-        endpointing_config.start_threshold = start_threshold
-    if stop_history > 0:
-        endpointing_config.stop_history = stop_history
-    if stop_history_eou > 0:
-        endpointing_config.stop_history_eou = stop_history_eou
-    if stop_threshold > 0:
-        endpointing_config.stop_threshold = stop_threshold
-    if stop_threshold_eou > 0:
-        endpointing_config.stop_threshold_eou = stop_threshold_eou
-    inner_config.endpointing_config.CopyFrom(endpointing_config)
+    inner_config.endpointing_config.CopyFrom(rasr.EndpointingConfig(**endpointing_parameters))
 
 
 def add_custom_configuration_to_config(
@@ -166,14 +159,14 @@ def add_custom_configuration_to_config(
         return
     inner_config: rasr.RecognitionConfig = config if isinstance(config, rasr.RecognitionConfig) else config.config
     for pair in custom_configuration.split(","):
-        key_value = pair.split(":")
-        if len(key_value) == 2:
-            inner_config.custom_configuration[key_value[0]] = key_value[1]
-        else:
-            raise ValueError(f"Invalid key:value pair {key_value}")
+        key, sep, value = pair.partition(":")
+        if not sep or ":" in value:
+            raise ValueError(f"Invalid key:value pair {pair}")
+        inner_config.custom_configuration[key] = value
 
 
 PRINT_STREAMING_ADDITIONAL_INFO_MODES = ['no', 'time', 'confidence']
+WORD_TIME_OFFSETS_HEADER = '{: <40s}{: <16s}{: <16s}\n'.format('Word', 'Start (ms)', 'End (ms)')
 
 
 def print_streaming(
@@ -249,11 +242,11 @@ def print_streaming(
             partial_transcript = ""
             for result in response.results:
                 if result.pipeline_states and len(result.pipeline_states.vad_probabilities) > 0:
-                    vad_prob_logs = "VAD States: "
-                    for vad_state in result.pipeline_states.vad_probabilities:
-                            vad_prob_logs += str(vad_state) + " "
-                    for i, f in enumerate(output_file):
-                        f.write(vad_prob_logs + "\n")
+                    vad_prob_logs = (
+                        "VAD States: " + " ".join(map(str, result.pipeline_states.vad_probabilities)) + " \n"
+                    )
+                    for f in output_file:
+                        f.write(vad_prob_logs)
                 if not result.alternatives:
                     continue
                 transcript = result.alternatives[0].transcript
@@ -266,30 +259,24 @@ def print_streaming(
                             num_chars_printed = 0
                         else:
                             for i, alternative in enumerate(result.alternatives):
+                                line = f'##' + (f'(alternative {i + 1})' if i > 0 else '') + f' {alternative.transcript}\n'
                                 for f in output_file:
-                                    f.write(
-                                        f'##'
-                                        + (f'(alternative {i + 1})' if i > 0 else '')
-                                        + f' {alternative.transcript}\n'
-                                    )
+                                    f.write(line)
                     else:
                         partial_transcript += transcript
                 elif additional_info == 'time':
                     if result.is_final:
                         for i, alternative in enumerate(result.alternatives):
+                            line = f"Time {time.time() - start_time:.2f}s: Transcript {i}: {alternative.transcript}\n"
                             for f in output_file:
-                                f.write(
-                                    f"Time {time.time() - start_time:.2f}s: Transcript {i}: {alternative.transcript}\n"
-                                )
+                                f.write(line)
                         if word_time_offsets:
+                            timestamps = "Timestamps:\n" + WORD_TIME_OFFSETS_HEADER + "".join(
+                                f'{word_info.word: <40s}{word_info.start_time: <16.0f}{word_info.end_time: <16.0f}\n'
+                                for word_info in result.alternatives[0].words
+                            )
                             for f in output_file:
-                                f.write("Timestamps:\n")
-                                f.write('{: <40s}{: <16s}{: <16s}\n'.format('Word', 'Start (ms)', 'End (ms)'))
-                                for word_info in result.alternatives[0].words:
-                                    f.write(
-                                        f'{word_info.word: <40s}{word_info.start_time: <16.0f}'
-                                        f'{word_info.end_time: <16.0f}\n'
-                                    )
+                                f.write(timestamps)
                     else:
                         partial_transcript += transcript
                 else:  # additional_info == 'confidence'
@@ -323,9 +310,7 @@ def print_streaming(
 def print_offline(response: rasr.RecognizeResponse) -> None:
     print(response)
     if len(response.results) > 0 and len(response.results[0].alternatives) > 0:
-        final_transcript = ""
-        for res in response.results:
-            final_transcript += res.alternatives[0].transcript
+        final_transcript = "".join(res.alternatives[0].transcript for res in response.results)
         print("Final transcript:", final_transcript)
 
 
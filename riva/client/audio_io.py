@@ -15,8 +15,9 @@ class MicrophoneStream:
         self._chunk = chunk
         self._device = device
 
-        # Create a thread-safe buffer of audio data
-        self._buff = queue.Queue()
+        # Create a thread-safe buffer of audio data. `SimpleQueue` is enough for one producer (PyAudio callback)
+        # and one consumer (request generator) and avoids `queue.Queue` condition variables.
+        self._buff = queue.SimpleQueue()
         self.closed = True
 
     def __enter__(self):
@@ -1,32 +1,46 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
 
+import functools
 import os
 from pathlib import Path
-from typing import List, Optional, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 import grpc
 
 
+@functools.lru_cache(maxsize=8)
+def _get_ssl_channel_credentials(ssl_cert: Optional[str], ssl_cert_mtime_ns: Optional[int]) -> grpc.ChannelCredentials:
+    # `ssl_cert_mtime_ns` is a part of the cache key so that a replaced certificate file is reloaded.
+    root_certificates = None
+    if ssl_cert is not None:
+        with open(ssl_cert, 'rb') as f:
+            root_certificates = f.read()
+    return grpc.ssl_channel_credentials(root_certificates)
+
+
 def create_channel(
-    ssl_cert: Optional[Union[str, os.PathLike]] = None, use_ssl: bool = False, uri: str = "localhost:50051", metadata: Optional[List[Tuple[str, str]]] = None,
+    ssl_cert: Optional[Union[str, os.PathLike]] = None,
+    use_ssl: bool = False,
+    uri: str = "localhost:50051",
+    metadata: Optional[List[Tuple[str, str]]] = None,
+    options: Optional[List[Tuple[str, Any]]] = None,
 ) -> grpc.Channel:
 
     def metadata_callback(context, callback):
         callback(metadata, None)
 
     if ssl_cert is not None or use_ssl:
-        root_certificates = None
         if ssl_cert is not None:
             ssl_cert = Path(ssl_cert).expanduser()
-            with open(ssl_cert, 'rb') as f:
-                root_certificates = f.read()
-        creds = grpc.ssl_channel_credentials(root_certificates)
+            creds = _get_ssl_channel_credentials(str(ssl_cert), ssl_cert.stat().st_mtime_ns)
+        else:
+            creds = _get_ssl_channel_credentials(None, None)
         if metadata:
             auth_creds = grpc.metadata_call_credentials(metadata_callback)
             creds = grpc.composite_channel_credentials(creds, auth_creds)
-        channel = grpc.secure_channel(uri, creds)
+        channel = grpc.secure_channel(uri, creds, options=options)
     else:
-        channel = grpc.insecure_channel(uri)
+        channel = grpc.insecure_channel(uri, options=options)
     return channel
 
 
@@ -37,6 +51,7 @@ class Auth:
         use_ssl: bool = False,
         uri: str = "localhost:50051",
         metadata_args: List[List[str]] = None,
+        options: Optional[List[Tuple[str, Any]]] = None,
     ) -> None:
         """
         A class responsible for establishing connection with a server and providing security metadata.
@@ -47,6 +62,9 @@ class Auth:
             use_ssl (:obj:`bool`, defaults to :obj:`False`): whether to use SSL. If :param:`ssl_cert` is :obj:`None`,
                 then SSL is still used but with default credentials.
             uri (:obj:`str`, defaults to :obj:`"localhost:50051"`): a Riva URI.
+            options (:obj:`List[Tuple[str, Any]]`, `optional`): gRPC channel arguments. For example, keepalive pings
+                which detect a dead server during long streaming sessions can be enabled with
+                ``[("grpc.keepalive_time_ms", 20000), ("grpc.keepalive_timeout_ms", 10000)]``.
         """
         self.ssl_cert: Optional[Path] = None if ssl_cert is None else Path(ssl_cert).expanduser()
         self.uri: str = uri
@@ -57,7 +75,7 @@ class Auth:
                 if len(meta) != 2:
                     raise ValueError(f"Metadata should have 2 parameters in \"key\" \"value\" pair. Receieved {len(meta)} parameters.")
                 self.metadata.append(tuple(meta))
-        self.channel: grpc.Channel = create_channel(self.ssl_cert, self.use_ssl, self.uri, self.metadata)
+        self.channel: grpc.Channel = create_channel(self.ssl_cert, self.use_ssl, self.uri, self.metadata, options)
 
     def get_auth_metadata(self) -> List[Tuple[str, str]]:
         """
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
 
+import io
 from typing import Generator, Optional, Union
 
 from grpc._channel import _MultiThreadedRendezvous
@@ -19,6 +20,17 @@ def add_custom_dictionary_to_config(req, custom_dictionary):
         result_string = ','.join(result_list)
         req.custom_dictionary = result_string
 
+def add_zero_shot_data_to_config(req, audio_prompt_file, audio_prompt_encoding, quality):
+    if audio_prompt_file is None:
+        return
+    with open(audio_prompt_file, 'rb') as wav_f:
+        audio_data = wav_f.read()
+    with wave.open(io.BytesIO(audio_data), 'rb') as wf:
+        req.zero_shot_data.sample_rate_hz = wf.getframerate()
+    req.zero_shot_data.audio_prompt = audio_data
+    req.zero_shot_data.encoding = audio_prompt_encoding
+    req.zero_shot_data.quality = quality
+
 class SpeechSynthesisService:
     """
     A class for synthesizing speech from text. Provides :meth:`synthesize` which returns entire audio for a text
@@ -81,16 +93,7 @@ class SpeechSynthesisService:
         )
         if voice_name is not None:
             req.voice_name = voice_name
-        if audio_prompt_file is not None:
-            with wave.open(str(audio_prompt_file), 'rb') as wf:
-                rate = wf.getframerate()
-                req.zero_shot_data.sample_rate_hz = rate
-            with audio_prompt_file.open('rb') as wav_f:
-                audio_data = wav_f.read()
-                req.zero_shot_data.audio_prompt = audio_data
-            req.zero_shot_data.encoding = audio_prompt_encoding
-            req.zero_shot_data.quality = quality
-
+        add_zero_shot_data_to_config(req, audio_prompt_file, audio_prompt_encoding, quality)
         add_custom_dictionary_to_config(req, custom_dictionary)
 
         func = self.stub.Synthesize.future if future else self.stub.Synthesize
@@ -141,17 +144,7 @@ class SpeechSynthesisService:
         )
         if voice_name is not None:
             req.voice_name = voice_name
-
-        if audio_prompt_file is not None:
-            with wave.open(str(audio_prompt_file), 'rb') as wf:
-                rate = wf.getframerate()
-                req.zero_shot_data.sample_rate_hz = rate
-            with audio_prompt_file.open('rb') as wav_f:
-                audio_data = wav_f.read()
-                req.zero_shot_data.audio_prompt = audio_data
-            req.zero_shot_data.encoding = audio_prompt_encoding
-            req.zero_shot_data.quality = quality
-
-        add_custom_dictionary_to_config(req, custom_dictionary)                   
+        add_zero_shot_data_to_config(req, audio_prompt_file, audio_prompt_encoding, quality)
+        add_custom_dictionary_to_config(req, custom_dictionary)
 
         return self.stub.SynthesizeOnline(req, metadata=self.auth.get_auth_metadata())
@@ -95,9 +95,6 @@ def parse_args() -> argparse.Namespace:
 def main() -> None:
     def request(inputs,args):
         try:
-            dnt_phrases_input = {}
-            if args.dnt_phrases_file != None:
-                dnt_phrases_input = read_dnt_phrases_file(args.dnt_phrases_file)
             response = nmt_client.translate(
                 texts=inputs,
                 model=args.model_name,
@@ -121,6 +118,10 @@ def main() -> None:
 
     args = parse_args()
 
+    dnt_phrases_input = {}
+    if args.dnt_phrases_file != None:
+        dnt_phrases_input = read_dnt_phrases_file(args.dnt_phrases_file)
+
     auth = riva.client.Auth(args.ssl_cert, args.use_ssl, args.server, args.metadata)
     nmt_client = riva.client.NeuralMachineTranslationClient(auth)
 
@@ -2,12 +2,20 @@
 # SPDX-License-Identifier: MIT
 
 from math import ceil
+from pathlib import Path
 from typing import Any, Generator, List, Union
 from unittest.mock import patch, Mock
 
+import pytest
+
 import riva.client.proto.riva_asr_pb2 as rasr
-from riva.client import ASRService
-from riva.client.asr import streaming_request_generator
+from riva.client import ASRService, AudioChunkFileIterator
+from riva.client.asr import (
+    add_custom_configuration_to_config,
+    add_endpoint_parameters_to_config,
+    get_wav_file_parameters,
+    streaming_request_generator,
+)
 
 from .helpers import set_auth_mock
 
@@ -32,6 +40,8 @@ RECOGNIZE_MOCK.future = Mock(return_value=RECOGNIZE_RESPONSE)
 
 STREAMING_RECOGNITION_CONFIG = rasr.StreamingRecognitionConfig()
 
+WAV_FILE = Path(__file__).parents[2] / 'data' / 'examples' / 'en-US_sample.wav'
+
 
 def response_generator(chunk_size: int = STREAMING_CHUNK_SIZE) -> Generator[rasr.StreamingRecognizeResponse, None, None]:
     for i in range(0, len(AUDIO_BYTES_1_SECOND), chunk_size):
@@ -92,3 +102,56 @@ class TestSpeechSynthesisService:
         assert len(STREAMING_RECOGNIZE_MOCK.call_args.kwargs) == 1
         assert 'metadata' in STREAMING_RECOGNIZE_MOCK.call_args.kwargs
         assert STREAMING_RECOGNIZE_MOCK.call_args.kwargs['metadata'] == return_value_of_get_auth_metadata
+
+
+class TestAudioChunkFileIterator:
+    def test_chunks_cover_whole_file(self) -> None:
+        chunk_n_frames = 1600
+        wav_parameters = get_wav_file_parameters(WAV_FILE)
+        chunk_n_bytes = chunk_n_frames * wav_parameters['sampwidth'] * wav_parameters['nchannels']
+        with AudioChunkFileIterator(WAV_FILE, chunk_n_frames) as audio_chunk_iterator:
+            chunks = list(audio_chunk_iterator)
+        assert all(len(chunk) == chunk_n_bytes for chunk in chunks[:-1])
+        assert 0 < len(chunks[-1]) <= chunk_n_bytes
+        assert b''.join(chunks) == WAV_FILE.read_bytes()
+
+    def test_delay_callback_gets_audio_duration(self) -> None:
+        delay_callback = Mock()
+        wav_parameters = get_wav_file_parameters(WAV_FILE)
+        with AudioChunkFileIterator(WAV_FILE, 1600, delay_callback) as audio_chunk_iterator:
+            for _ in audio_chunk_iterator:
+                pass
+        total_duration = sum(call.args[1] for call in delay_callback.call_args_list)
+        assert abs(total_duration - wav_parameters['duration']) < 1e-6
+
+
+class TestAddEndpointParametersToConfig:
+    def test_only_positive_parameters_are_set(self) -> None:
+        config = rasr.StreamingRecognitionConfig()
+        add_endpoint_parameters_to_config(config, 100, -1.0, -1, 200, 0.5, -1.0)
+        assert config.config.HasField('endpointing_config')
+        assert config.config.endpointing_config == rasr.EndpointingConfig(
+            start_history=100, stop_history_eou=200, stop_threshold=0.5
+        )
+
+    def test_config_is_untouched_without_positive_parameters(self) -> None:
+        config = rasr.RecognitionConfig()
+        add_endpoint_parameters_to_config(config, -1, -1.0, -1, -1, -1.0, -1.0)
+        assert not config.HasField('endpointing_config')
+
+
+class TestAddCustomConfigurationToConfig:
+    def test_pairs_are_parsed(self) -> None:
+        config = rasr.StreamingRecognitionConfig()
+        add_custom_configuration_to_config(config, " foo : 1, bar:baz ")
+        assert dict(config.config.custom_configuration) == {'foo': '1', 'bar': 'baz'}
+
+    def test_empty_string_is_ignored(self) -> None:
+        config = rasr.RecognitionConfig()
+        add_custom_configuration_to_config(config, "  ")
+        assert len(config.custom_configuration) == 0
+
+    @pytest.mark.parametrize("custom_configuration", ["foo", "foo:1:2", "foo:1,"])
+    def test_invalid_pair_raises(self, custom_configuration: str) -> None:
+        with pytest.raises(ValueError):
+            add_custom_configuration_to_config(rasr.RecognitionConfig(), custom_configuration)
@@ -5,7 +5,7 @@ from unittest.mock import Mock, patch
 
 import grpc
 
-from riva.client.auth import create_channel, Auth
+from riva.client.auth import _get_ssl_channel_credentials, create_channel, Auth
 
 
 @patch("grpc.insecure_channel", Mock(return_value="insecure_channel"))
@@ -14,6 +14,27 @@ def test_create_channel() -> None:
     assert channel == "insecure_channel"
 
 
+def test_create_channel_passes_options() -> None:
+    options = [("grpc.keepalive_time_ms", 20000)]
+    with patch("grpc.insecure_channel", Mock(return_value="insecure_channel")) as insecure_channel_mock:
+        create_channel(options=options)
+    insecure_channel_mock.assert_called_once_with("localhost:50051", options=options)
+
+
+@patch("grpc.secure_channel", Mock(return_value="secure_channel"))
+def test_create_channel_reuses_ssl_credentials(tmp_path) -> None:
+    ssl_cert = tmp_path / "root.pem"
+    ssl_cert.write_bytes(b"certificate")
+    _get_ssl_channel_credentials.cache_clear()
+    try:
+        with patch("grpc.ssl_channel_credentials", Mock(return_value="credentials")) as credentials_mock:
+            assert create_channel(ssl_cert=ssl_cert) == "secure_channel"
+            assert create_channel(ssl_cert=ssl_cert) == "secure_channel"
+        credentials_mock.assert_called_once_with(b"certificate")
+    finally:
+        _get_ssl_channel_credentials.cache_clear()
+
+
 class TestAuth:
     @patch("grpc.insecure_channel", Mock(return_value="insecure_channel"))
     def test_channel_is_set(self) -> None:
@@ -1,7 +1,9 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
 
+import wave
 from math import ceil
+from pathlib import Path
 from typing import Any, Generator
 from unittest.mock import patch, Mock
 
@@ -22,6 +24,8 @@ STREAMING_CHUNK_SIZE = 1000
 
 AUDIO_BYTES_1_SECOND = b'a' * SAMPLE_WIDTH * SAMPLE_RATE_HZ
 
+AUDIO_PROMPT_FILE = Path(__file__).parents[2] / 'data' / 'examples' / 'en-US_sample.wav'
+
 
 def response_generator(chunk_size: int = STREAMING_CHUNK_SIZE) -> Generator[rtts.SynthesizeSpeechResponse, None, None]:
     for i in range(0, len(AUDIO_BYTES_1_SECOND), chunk_size):
@@ -114,4 +118,24 @@ class TestSpeechSynthesisService:
             count += 1
         assert count == ceil(len(AUDIO_BYTES_1_SECOND) / STREAMING_CHUNK_SIZE)
 
-
+    def test_synthesize_with_audio_prompt(self) -> None:
+        auth, return_value_of_get_auth_metadata = set_auth_mock()
+        SYNTHESIZE_MOCK.reset_mock()
+        service = SpeechSynthesisService(auth)
+        service.synthesize(
+            TEXT, VOICE_NAME, LANGUAGE_CODE, ENCODING, SAMPLE_RATE_HZ, audio_prompt_file=AUDIO_PROMPT_FILE, quality=10
+        )
+        with wave.open(str(AUDIO_PROMPT_FILE), 'rb') as wf:
+            prompt_sample_rate_hz = wf.getframerate()
+        expected_request = rtts.SynthesizeSpeechRequest(
+            text=TEXT,
+            voice_name=VOICE_NAME,
+            language_code=LANGUAGE_CODE,
+            encoding=ENCODING,
+            sample_rate_hz=SAMPLE_RATE_HZ,
+        )
+        expected_request.zero_shot_data.sample_rate_hz = prompt_sample_rate_hz
+        expected_request.zero_shot_data.audio_prompt = AUDIO_PROMPT_FILE.read_bytes()
+        expected_request.zero_shot_data.encoding = AudioEncoding.LINEAR_PCM
+        expected_request.zero_shot_data.quality = 10
+        SYNTHESIZE_MOCK.assert_called_with(expected_request, metadata=return_value_of_get_auth_metadata)